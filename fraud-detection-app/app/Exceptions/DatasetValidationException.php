@@ -0,0 +1,24 @@
+<?php
+
+namespace App\Exceptions;
+
+/**
+ * PHASE 8 — Dataset Validation Exception
+ * Thrown by MlApiService when the Python ML service rejects a dataset
+ * with HTTP 422 during its pre-validation pass.
+ *
+ * The rejection will not change on retry, so ProcessDatasetJob fails the
+ * job immediately and records the validation errors.
+ */
+
+use RuntimeException;
+
+class DatasetValidationException extends RuntimeException
+{
+    public function __construct(
+        public readonly array $errors,
+        public readonly array $warnings = []
+    ) {
+        parent::__construct('Dataset failed validation: ' . implode('; ', $errors));
+    }
+}
@@ -40,6 +40,7 @@ class FraudResultApiController extends Controller
             'results.*.region'          => ['nullable', 'string'],
             'results.*.amount'          => ['nullable', 'numeric'],
             'error_message' => ['nullable', 'string'],
+            'drift'         => ['nullable', 'array'],
         ]);
 
         $dataset = Dataset::findOrFail($validated['dataset_id']);
@@ -88,7 +89,12 @@ class FraudResultApiController extends Controller
             'ml_results_received',
             "ML results received for dataset #{$dataset->id}: " . count($records) . " records",
             null,
-            ['dataset_id' => $dataset->id, 'fraud_count' => collect($records)->where('is_fraud', true)->count()]
+            [
+                'dataset_id'      => $dataset->id,
+                'fraud_count'     => collect($records)->where('is_fraud', true)->count(),
+                'drifted_columns' => $validated['drift']['drifted_columns'] ?? [],
+                'score_psi'       => $validated['drift']['score']['psi'] ?? null,
+            ]
         );
 
         return response()->json(['message' => 'Results stored successfully', 'count' => count($records)], 200);
@@ -15,6 +15,7 @@ namespace App\Jobs;
  * Driver: Redis (recommended) or database
  */
 
+use App\Exceptions\DatasetValidationException;
 use App\Models\Dataset;
 use App\Models\JobLog;
 use App\Models\AuditLog;
@@ -65,13 +66,36 @@ class ProcessDatasetJob implements ShouldQueue
 
         // Call Python ML microservice
         // MlApiService handles HTTP communication and error handling
-        $mlApi->processDataset(
-            datasetId:    $this->dataset->id,
-            datasetPath:  $this->dataset->path,
-            jobReference: $this->jobReference,
-            callbackUrl:  route('api.internal.ml-results') // Python posts results here
-        );
-
+        // Python validates a sample of the file first and rejects it with 422
+        try {
+            $response = $mlApi->processDataset(
+                datasetId:    $this->dataset->id,
+                datasetPath:  $this->dataset->path,
+                jobReference: $this->jobReference,
+                callbackUrl:  route('api.internal.ml-results') // Python posts results here
+            );
+        } catch (DatasetValidationException $e) {
+            // Retrying cannot fix an invalid file — fail now without retries.
+            // failed() stores the errors on the job log and marks the dataset failed.
+            AuditLog::record(
+                'dataset_validation_failed',
+                "Dataset #{$this->dataset->id} rejected by ML service validation",
+                $this->dataset->uploaded_by,
+                [
+                    'dataset_id'    => $this->dataset->id,
+                    'job_reference' => $this->jobReference,
+                    'errors'        => $e->errors,
+                    'warnings'      => $e->warnings,
+                ]
+            );
+
+            $this->fail($e);
+            return;
+        }
+
+        // The row estimate from validation is approximate, so it is only kept
+        // in the audit context below — row_count is set from the exact count
+        // when Python posts results back.
         // Note: Job log is updated by FraudResultApiController when Python
         // posts results back via the callback URL. This job's role is only
         // to trigger the Python service — not to wait for results.
@@ -80,7 +104,12 @@ class ProcessDatasetJob implements ShouldQueue
             'ml_job_dispatched',
             "ML processing job dispatched for dataset #{$this->dataset->id}",
             $this->dataset->uploaded_by,
-            ['dataset_id' => $this->dataset->id, 'job_reference' => $this->jobReference]
+            [
+                'dataset_id'     => $this->dataset->id,
+                'job_reference'  => $this->jobReference,
+                'estimated_rows' => $response['estimated_rows'] ?? null,
+                'warnings'       => $response['warnings'] ?? [],
+            ]
         );
     }
 
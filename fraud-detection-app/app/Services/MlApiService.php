@@ -12,6 +12,7 @@ namespace App\Services;
  *   ML_SERVICE_SECRET=your-shared-secret
  */
 
+use App\Exceptions\DatasetValidationException;
 use App\Models\AuditLog;
 use Illuminate\Http\Client\ConnectionException;
 use Illuminate\Http\Client\RequestException;
@@ -86,7 +87,9 @@ class MlApiService
         try {
             $response = Http::timeout($this->timeoutSeconds)
                 ->withHeaders($this->authHeaders())
-                ->retry(2, 1000) // Retry twice with 1s delay
+                // Retry twice with 1s delay — but not a 422 validation rejection,
+                // which will not change on retry
+                ->retry(2, 1000, fn ($e) => ! ($e instanceof RequestException && $e->response->status() === 422))
                 ->post("{$this->baseUrl}{$endpoint}", $payload);
 
             if ($response->failed()) {
@@ -107,6 +110,18 @@ class MlApiService
 
         } catch (RequestException $e) {
             $this->logApiError($endpoint, $e->response->status(), $e->getMessage());
+
+            // Python rejected the dataset during pre-validation. Other 422s
+            // (e.g. FastAPI request-body errors, where detail is a list)
+            // fall through to the generic error below.
+            $validationErrors = $e->response->json('detail.errors');
+            if ($e->response->status() === 422 && is_array($validationErrors) && $validationErrors) {
+                throw new DatasetValidationException(
+                    $validationErrors,
+                    $e->response->json('detail.warnings', [])
+                );
+            }
+
             throw new \RuntimeException("ML API request failed: " . $e->getMessage());
         }
     }
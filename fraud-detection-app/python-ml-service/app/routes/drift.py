@@ -0,0 +1,40 @@
+"""
+PHASE 8 — Drift Route
+Exposes the drift reports produced while scoring datasets.
+Reports are kept in memory for the last DRIFT_HISTORY_SIZE jobs and are
+also sent to Laravel with the results callback.
+"""
+
+from fastapi import APIRouter, HTTPException
+
+from app.services.drift_monitor import get_report, list_reports
+
+router = APIRouter()
+
+
+@router.get("/drift")
+async def recent_drift():
+    """
+    Summary of recent jobs: which columns drifted and the score PSI.
+    """
+    return {
+        job_id: {
+            "drifted_columns": report["drifted_columns"],
+            "score_psi":       report["score"]["psi"],
+        }
+        for job_id, report in list_reports().items()
+    }
+
+
+@router.get("/drift/{job_id}")
+async def job_drift(job_id: str):
+    """
+    Full drift report for one job.
+    """
+    report = get_report(job_id)
+    if report is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No drift report for job: {job_id}"
+        )
+    return report
@@ -13,9 +13,12 @@ import asyncio
 from fastapi import APIRouter, BackgroundTasks, HTTPException
 from pydantic import BaseModel
 import httpx
+from typing import Dict, Any, Optional
 
 from app.services.fraud_detector import FraudDetectorService
 from app.services.callback_service import CallbackService
+from app.services.drift_monitor import DriftMonitor, record_report, load_reference_profile
+from app.services.dataset_validator import DatasetValidator
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -36,7 +39,8 @@ async def process_dataset(
 ):
     """
     Accepts a dataset processing request from Laravel.
-    Immediately returns 202 Accepted, then processes in background.
+    Validates a sample of the file synchronously (422 if it is unusable),
+    then returns 202 Accepted and processes in background.
     Results are POSTed back to Laravel via callback_url.
     """
     logger.info(f"Received processing request for dataset {request.dataset_id}, job {request.job_id}")
@@ -49,19 +53,40 @@ async def process_dataset(
             detail=f"Dataset file not found: {request.dataset_path}"
         )
 
+    # Check header and sampled rows against the features the model was trained on.
+    # The profile is loaded once here and reused by the drift monitor.
+    reference = load_reference_profile()
+    validator = DatasetValidator(expected_features=list((reference or {}).get("features", {})))
+    validation = validator.validate(request.dataset_path)
+
+    if not validation["valid"]:
+        logger.warning(f"Dataset {request.dataset_id} rejected: {validation['errors']}")
+        raise HTTPException(
+            status_code=422,
+            detail={"message": "Dataset failed validation", **validation}
+        )
+
+    for warning in validation["warnings"]:
+        logger.warning(f"Dataset {request.dataset_id}: {warning}")
+
     # Process in background — don't block the HTTP response
     background_tasks.add_task(
         _process_and_callback,
         request.dataset_id,
         request.dataset_path,
         request.job_id,
-        request.callback_url
+        request.callback_url,
+        validation["chunk_size"],
+        reference
     )
 
     return {
         "status": "accepted",
         "message": "Dataset queued for processing",
-        "job_id": request.job_id
+        "job_id": request.job_id,
+        "estimated_rows": validation["estimated_rows"],
+        "chunk_size": validation["chunk_size"],
+        "warnings": validation["warnings"]
     }
 
 
@@ -70,7 +95,9 @@ async def _process_and_callback(
     dataset_id: int,
     dataset_path: str,
     job_id: str,
-    callback_url: str
+    callback_url: str,
+    chunk_size: int,
+    reference: Optional[Dict[str, Any]] = None
 ):
     """
     Runs ML fraud detection on the dataset and POSTs results to Laravel.
@@ -78,22 +105,29 @@ async def _process_and_callback(
     """
     detector = FraudDetectorService()
     callback = CallbackService()
+    monitor = _create_monitor(reference)
 
     try:
         logger.info(f"Starting ML processing for dataset {dataset_id}")
 
         # Run fraud detection — replace with your actual ML model
-        results = await detector.predict(dataset_path)
+        results = await detector.predict(dataset_path, monitor=monitor, chunk_size=chunk_size)
 
         logger.info(f"ML processing complete: {len(results)} records processed")
 
+        # Compare feature / score distributions with the training reference
+        drift = _drift_report(job_id, monitor)
+        if drift and drift["drifted_columns"]:
+            logger.warning(f"Drift detected for dataset {dataset_id}: {drift['drifted_columns']}")
+
         # POST results back to Laravel
         await callback.post_results(
             callback_url=callback_url,
             dataset_id=dataset_id,
             job_id=job_id,
             status="success",
-            results=results
+            results=results,
+            drift=drift
         )
 
     except Exception as e:
@@ -108,3 +142,28 @@ async def _process_and_callback(
             results=[],
             error_message=str(e)
         )
+
+
+# ── Drift helpers ─────────────────────────────────────
+# Drift monitoring must never fail fraud scoring: any error here is logged
+# and the results are sent with drift=None.
+def _create_monitor(reference: Optional[Dict[str, Any]]) -> Optional[DriftMonitor]:
+    try:
+        return DriftMonitor(reference)
+    except Exception as e:
+        logger.error(f"Invalid reference profile, drift monitoring disabled: {e}")
+        return None
+
+
+def _drift_report(job_id: str, monitor: Optional[DriftMonitor]) -> Optional[Dict[str, Any]]:
+    if monitor is None or monitor.error is not None:
+        return None
+
+    try:
+        drift = monitor.report()
+    except Exception as e:
+        logger.error(f"Drift report failed for job {job_id}: {e}")
+        return None
+
+    record_report(job_id, drift)
+    return drift
@@ -31,7 +31,8 @@ class CallbackService:
         job_id: str,
         status: str,
         results: List[Dict[str, Any]],
-        error_message: Optional[str] = None
+        error_message: Optional[str] = None,
+        drift: Optional[Dict[str, Any]] = None
     ) -> bool:
         """
         POST fraud detection results to Laravel.
@@ -43,6 +44,7 @@ class CallbackService:
             status: 'success' or 'failed'
             results: List of fraud result dicts
             error_message: Error description if status is 'failed'
+            drift: Drift report from DriftMonitor.report(), if available
 
         Returns:
             True if callback succeeded, False otherwise
@@ -53,6 +55,7 @@ class CallbackService:
             "status":        status,
             "results":       results if status == "success" else [],
             "error_message": error_message,
+            "drift":         drift,
         }
 
         return await self._post(callback_url, payload)
@@ -0,0 +1,210 @@
+"""
+PHASE 8 — Dataset Validator Service
+Fast pre-validation of a CSV before /process-dataset accepts it.
+
+Instead of loading the whole file, the validator reads the header and a
+handful of evenly spaced byte ranges, then:
+  - checks the header has transaction_id and the features the model expects
+  - checks sampled rows have the right number of fields
+  - checks amount and the model's feature columns parse as numbers
+  - estimates the row count from file size / average sampled row size
+
+The estimate also picks the chunk size used by FraudDetectorService.predict()
+and is returned to Laravel with the 202 response.
+"""
+
+import os
+import csv
+import io
+import logging
+from typing import List, Dict, Any, Optional
+
+from app.services.fraud_detector import CHUNK_SIZE, EXCLUDED_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+# Number of byte ranges sampled from the body of the file
+SAMPLE_RANGES = int(os.getenv("VALIDATION_SAMPLE_RANGES", "8"))
+
+# Size of each sampled byte range
+SAMPLE_BYTES = int(os.getenv("VALIDATION_SAMPLE_BYTES", "16384"))
+
+# Target CSV bytes per scoring chunk (rows per chunk = this / avg row size)
+TARGET_CHUNK_BYTES = int(os.getenv("TARGET_CHUNK_BYTES", str(32 * 1024 * 1024)))
+
+# Lower bound on rows per chunk so tiny rows don't create thousands of chunks
+MIN_CHUNK_SIZE = 10000
+
+# Values treated as missing rather than non-numeric (matches pandas defaults)
+_NA_VALUES = {"", "na", "nan", "n/a", "null", "none", "-nan", "#n/a"}
+
+
+class DatasetValidator:
+    """
+    Samples a CSV file and checks it against the model's expected features.
+    """
+
+    def __init__(self, expected_features: Optional[List[str]] = None):
+        self.expected_features = expected_features or []
+
+    def validate(self, dataset_path: str) -> Dict[str, Any]:
+        """
+        Validate a CSV dataset without loading it.
+
+        Args:
+            dataset_path: Absolute path to the CSV file
+
+        Returns:
+            Dict with valid, errors, warnings, columns, estimated_rows,
+            file_size and chunk_size
+        """
+        errors: List[str] = []
+        warnings: List[str] = []
+        file_size = os.path.getsize(dataset_path)
+
+        report = {
+            "valid":          False,
+            "errors":         errors,
+            "warnings":       warnings,
+            "columns":        [],
+            "estimated_rows": 0,
+            "file_size":      file_size,
+            "chunk_size":     CHUNK_SIZE,
+        }
+
+        with open(dataset_path, "rb") as f:
+            header_line = f.readline()
+            header_bytes = f.tell()
+            rows = self._sample_rows(f, header_bytes, file_size)
+
+        try:
+            columns = next(csv.reader([header_line.decode("utf-8-sig")]), [])
+        except UnicodeDecodeError:
+            errors.append("File is not valid UTF-8 text")
+            return report
+
+        columns = [c.strip() for c in columns]
+        report["columns"] = columns
+
+        if not columns or columns == [""]:
+            errors.append("CSV file is empty or has no header row")
+            return report
+
+        # ── Schema checks ─────────────────────────────────
+        if "transaction_id" not in columns:
+            errors.append("CSV must contain a 'transaction_id' column")
+
+        missing = [c for c in self.expected_features if c not in columns]
+        if missing:
+            errors.append(f"Missing feature columns expected by the model: {missing}")
+
+        # ── Sampled row checks ────────────────────────────
+        # pandas cannot read rows with extra fields, so any such row is an
+        # error. Short rows are filled with NaN by pandas — only a warning.
+        lines = [line for line, _ in rows]
+        too_wide = [line for line in lines if len(line) > len(columns)]
+        too_short = [line for line in lines if len(line) < len(columns)]
+        if too_wide:
+            errors.append(
+                f"{len(too_wide)}/{len(lines)} sampled rows have more than {len(columns)} fields"
+            )
+        if too_short:
+            warnings.append(
+                f"{len(too_short)}/{len(lines)} sampled rows have fewer than {len(columns)} fields"
+            )
+
+        # Columns predict() always converts to numbers: amount, plus the
+        # model features — from the reference profile if there is one,
+        # otherwise every feature column except a text vendor_id
+        feature_columns = [c for c in columns if c not in EXCLUDED_COLUMNS]
+        required_numeric = set(
+            self.expected_features or [c for c in feature_columns if c != "vendor_id"]
+        ) | {"amount"}
+
+        for i, col in enumerate(columns):
+            if col not in feature_columns:
+                continue
+            values = [line[i] for line in lines if len(line) == len(columns)]
+            if not values or all(_is_number(v) for v in values):
+                continue
+            if col in required_numeric:
+                errors.append(f"Column '{col}' contains non-numeric values")
+            else:
+                warnings.append(f"Column '{col}' contains non-numeric values")
+
+        # ── Size estimate ─────────────────────────────────
+        if rows:
+            avg_row_bytes = sum(size for _, size in rows) / len(rows)
+            report["estimated_rows"] = round((file_size - header_bytes) / avg_row_bytes)
+            report["chunk_size"] = choose_chunk_size(avg_row_bytes)
+        elif file_size > header_bytes:
+            warnings.append("Could not sample any complete rows")
+        else:
+            errors.append("CSV file has a header but no rows")
+
+        report["valid"] = not errors
+        return report
+
+    def _sample_rows(self, f, header_bytes: int, file_size: int) -> List[tuple]:
+        """
+        Read SAMPLE_RANGES evenly spaced byte ranges from the body.
+        The partial line at the start of each range (except the first) and
+        at its end are dropped, so only complete rows are parsed. Lines with
+        an odd number of quotes are pieces of a quoted field that spans
+        several lines (e.g. "Acme\\nInc") and are skipped too.
+
+        Returns:
+            List of (parsed fields, raw byte length) per sampled row
+        """
+        body = file_size - header_bytes
+        if body <= 0:
+            return []
+
+        if body <= SAMPLE_RANGES * SAMPLE_BYTES:
+            offsets = [header_bytes]
+        else:
+            step = (body - SAMPLE_BYTES) // max(SAMPLE_RANGES - 1, 1)
+            offsets = [header_bytes + i * step for i in range(SAMPLE_RANGES)]
+
+        rows = []
+        for offset in offsets:
+            f.seek(offset)
+            chunk = f.read(SAMPLE_BYTES if len(offsets) > 1 else body)
+            raw_lines = chunk.split(b"\n")
+
+            if offset != header_bytes:
+                raw_lines = raw_lines[1:]
+            if offset + len(chunk) < file_size:
+                raw_lines = raw_lines[:-1]
+
+            for raw in raw_lines:
+                if not raw.strip() or raw.count(b'"') % 2:
+                    continue
+                try:
+                    text = raw.decode("utf-8").rstrip("\r")
+                except UnicodeDecodeError:
+                    continue
+                fields = next(csv.reader(io.StringIO(text)), [])
+                rows.append((fields, len(raw) + 1))
+
+        return rows
+
+
+def choose_chunk_size(avg_row_bytes: float) -> int:
+    """
+    Rows per scoring chunk so that one chunk is about TARGET_CHUNK_BYTES of
+    CSV text, never above CHUNK_SIZE.
+    """
+    rows = int(TARGET_CHUNK_BYTES / max(avg_row_bytes, 1))
+    return min(CHUNK_SIZE, max(MIN_CHUNK_SIZE, rows))
+
+
+def _is_number(value: str) -> bool:
+    value = value.strip()
+    if value.lower() in _NA_VALUES:
+        return True
+    try:
+        float(value)
+        return True
+    except ValueError:
+        return False
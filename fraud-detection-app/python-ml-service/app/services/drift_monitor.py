@@ -0,0 +1,331 @@
+"""
+PHASE 8 — Drift Monitor Service
+Tracks whether incoming features and output fraud scores drift away from
+the distribution the model was trained on.
+
+Each feature (and the fraud score) gets a streaming sketch that is updated
+chunk by chunk while the dataset is scored. A sketch holds only a fixed
+number of histogram bins plus a few counters, so memory stays constant no
+matter how many rows pass through it.
+
+The histogram bins are the reference quantiles saved with the model, which
+makes PSI (Population Stability Index) and a KS-style max CDF gap cheap to
+compute at the end of the job.
+
+Reference profile:
+  Built offline at training time with build_reference_profile() and saved
+  next to the model (REFERENCE_PROFILE_PATH). Without it, only basic stats
+  (row count, null rate, mean, min, max) are reported.
+
+Integration:
+  predict.py passes a DriftMonitor into FraudDetectorService.predict(),
+  then sends monitor.report() to Laravel with the results callback and
+  keeps it for GET /drift/{job_id}.
+"""
+
+import os
+import json
+import logging
+import numpy as np
+import pandas as pd
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# Reference profile saved alongside the trained model
+REFERENCE_PROFILE_PATH = os.getenv("REFERENCE_PROFILE_PATH", "./models/reference_profile.json")
+
+# PSI above this = feature flagged as drifted (0.1 minor, 0.2 significant)
+DRIFT_PSI_THRESHOLD = float(os.getenv("DRIFT_PSI_THRESHOLD", "0.2"))
+
+# Number of recent job reports kept in memory for GET /drift
+DRIFT_HISTORY_SIZE = int(os.getenv("DRIFT_HISTORY_SIZE", "50"))
+
+# Default number of quantile bins when building a reference profile
+DEFAULT_BINS = 10
+
+# Score bins used when the reference profile has no score entry
+DEFAULT_SCORE_EDGES = np.linspace(0.0, 1.0, DEFAULT_BINS + 1)[1:-1]
+
+# Avoids log(0) / division by zero for empty bins in PSI
+_EPSILON = 1e-6
+
+# Name under which the fraud score sketch is reported
+SCORE_KEY = "fraud_score"
+
+
+class StreamingSketch:
+    """
+    Constant-memory summary of one numeric column.
+    Counts values into fixed bins (defined by the inner cut points `edges`)
+    and keeps running null count, sum, min and max.
+    """
+
+    def __init__(self, edges: Optional[List[float]] = None):
+        self.edges = np.asarray(edges, dtype=float) if edges is not None else None
+        self.counts = np.zeros(len(self.edges) + 1, dtype=np.int64) if self.edges is not None else None
+        self.total = 0
+        self.nulls = 0
+        self.sum = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def update(self, values) -> None:
+        """
+        Add a chunk of values to the sketch.
+        float32 columns (see FraudDetectorService._compact) are binned
+        against float32-rounded edges, so a value sitting exactly on a
+        reference edge (e.g. 0.7) lands in the same bin as in float64.
+        """
+        values = np.asarray(values)
+        edges = self.edges
+        if edges is not None and values.dtype == np.float32:
+            edges = edges.astype(np.float32)
+
+        values = values.astype(float)
+        mask = np.isnan(values)
+        valid = values[~mask]
+
+        self.total += len(values)
+        self.nulls += int(mask.sum())
+
+        if len(valid) == 0:
+            return
+
+        self.sum += float(valid.sum())
+        self.min = min(self.min, float(valid.min()))
+        self.max = max(self.max, float(valid.max()))
+
+        if self.edges is not None:
+            bins = np.searchsorted(edges, valid, side="right")
+            self.counts += np.bincount(bins, minlength=len(self.counts))
+
+    @property
+    def valid(self) -> int:
+        return self.total - self.nulls
+
+    def proportions(self) -> Optional[np.ndarray]:
+        if self.counts is None or self.valid == 0:
+            return None
+        return self.counts / self.valid
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Approximate quantile, interpolated linearly inside the matching bin.
+        The outer bins are bounded by the observed min / max.
+        """
+        props = self.proportions()
+        if props is None:
+            return None
+
+        bounds = np.concatenate(([self.min], self.edges, [self.max]))
+        cumulative = np.concatenate(([0.0], np.cumsum(props)))
+        i = int(np.searchsorted(cumulative, q, side="left"))
+        i = min(max(i, 1), len(props))
+
+        lo, hi = bounds[i - 1], bounds[i]
+        lo, hi = max(lo, self.min), min(hi, self.max)
+        width = props[i - 1]
+        frac = (q - cumulative[i - 1]) / width if width > 0 else 0.0
+        return float(lo + (hi - lo) * min(max(frac, 0.0), 1.0))
+
+    def summary(self) -> Dict[str, Any]:
+        has_values = self.valid > 0
+        return {
+            "count":     self.total,
+            "null_rate": round(self.nulls / self.total, 6) if self.total else 0.0,
+            "mean":      round(self.sum / self.valid, 6) if has_values else None,
+            "min":       self.min if has_values else None,
+            "max":       self.max if has_values else None,
+            "p50":       self.quantile(0.5),
+            "p90":       self.quantile(0.9),
+            "p99":       self.quantile(0.99),
+        }
+
+
+class DriftMonitor:
+    """
+    Holds one StreamingSketch per numeric feature plus one for the fraud
+    score, and compares them with the reference profile at report time.
+    """
+
+    def __init__(self, reference: Optional[Dict[str, Any]] = None):
+        self.reference = reference or {}
+        self.feature_sketches: Dict[str, StreamingSketch] = {}
+
+        # Set by FraudDetectorService.predict() if an update fails;
+        # the monitor then stops updating and no report is produced
+        self.error: Optional[str] = None
+
+        score_ref = self.reference.get("score")
+        score_edges = score_ref["edges"] if score_ref else DEFAULT_SCORE_EDGES
+        self.score_sketch = StreamingSketch(score_edges)
+
+    @classmethod
+    def from_reference(cls, path: str = REFERENCE_PROFILE_PATH) -> "DriftMonitor":
+        """
+        Create a monitor using the reference profile saved with the model.
+        Falls back to an empty reference if the file is missing or invalid.
+        """
+        return cls(load_reference_profile(path))
+
+    def update(self, features: pd.DataFrame, scores: np.ndarray) -> None:
+        """
+        Add one scored chunk. Only numeric feature columns are tracked.
+        """
+        ref_features = self.reference.get("features", {})
+
+        for col in features.select_dtypes(include="number").columns:
+            sketch = self.feature_sketches.get(col)
+            if sketch is None:
+                ref = ref_features.get(col)
+                sketch = StreamingSketch(ref["edges"] if ref else None)
+                self.feature_sketches[col] = sketch
+            sketch.update(features[col].to_numpy())
+
+        self.score_sketch.update(scores)
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Build the drift report: per-column stats plus PSI / KS against the
+        reference profile where one is available.
+        """
+        ref_features = self.reference.get("features", {})
+
+        features = {
+            col: self._compare(sketch, ref_features.get(col))
+            for col, sketch in self.feature_sketches.items()
+        }
+        score = self._compare(self.score_sketch, self.reference.get("score"))
+
+        drifted = [col for col, stats in features.items() if stats["drifted"]]
+        if score["drifted"]:
+            drifted.append(SCORE_KEY)
+
+        return {
+            "has_reference":    bool(self.reference),
+            "psi_threshold":    DRIFT_PSI_THRESHOLD,
+            "drifted_columns":  drifted,
+            "score":            score,
+            "features":         features,
+        }
+
+    def _compare(self, sketch: StreamingSketch, ref: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        stats = sketch.summary()
+        stats.update({"psi": None, "ks": None, "null_rate_delta": None, "drifted": False})
+
+        if ref is None:
+            return stats
+
+        stats["null_rate_delta"] = round(stats["null_rate"] - ref.get("null_rate", 0.0), 6)
+
+        actual = sketch.proportions()
+        if actual is None:
+            return stats
+
+        expected = np.asarray(ref["proportions"], dtype=float)
+        psi = population_stability_index(expected, actual)
+        ks = float(np.max(np.abs(np.cumsum(actual) - np.cumsum(expected))))
+
+        stats["psi"] = round(psi, 6)
+        stats["ks"] = round(ks, 6)
+        stats["drifted"] = psi >= DRIFT_PSI_THRESHOLD
+        return stats
+
+
+def population_stability_index(expected: np.ndarray, actual: np.ndarray) -> float:
+    """
+    PSI = sum((actual - expected) * ln(actual / expected)) over bins.
+    """
+    expected = np.clip(expected, _EPSILON, None)
+    actual = np.clip(actual, _EPSILON, None)
+    return float(np.sum((actual - expected) * np.log(actual / expected)))
+
+
+def build_reference_profile(
+    features: pd.DataFrame,
+    scores: np.ndarray,
+    n_bins: int = DEFAULT_BINS
+) -> Dict[str, Any]:
+    """
+    Build a reference profile from the training data and the model's scores
+    on it. Bin edges are the training quantiles, so each bin holds roughly
+    1/n_bins of the reference rows.
+
+    Run this in Phase 2 after training and save it with save_reference_profile().
+    """
+    profile = {"row_count": len(features), "features": {}}
+
+    for col in features.select_dtypes(include="number").columns:
+        profile["features"][col] = _reference_entry(features[col].to_numpy(dtype=float), n_bins)
+
+    profile["score"] = _reference_entry(np.asarray(scores, dtype=float), n_bins)
+    return profile
+
+
+def load_reference_profile(path: str = REFERENCE_PROFILE_PATH) -> Optional[Dict[str, Any]]:
+    """
+    Load the reference profile saved with the model, or None if it is
+    missing or invalid.
+    """
+    if not os.path.exists(path):
+        logger.warning(
+            f"Reference profile not found at {path}. "
+            "Drift PSI/KS and expected-feature checks are skipped."
+        )
+        return None
+
+    try:
+        with open(path) as f:
+            reference = json.load(f)
+        if not isinstance(reference, dict):
+            raise ValueError("reference profile must be a JSON object")
+        logger.info(f"Reference profile loaded from {path}")
+        return reference
+    except Exception as e:
+        logger.error(f"Failed to load reference profile: {e}")
+        return None
+
+
+def save_reference_profile(profile: Dict[str, Any], path: str = REFERENCE_PROFILE_PATH) -> None:
+    with open(path, "w") as f:
+        json.dump(profile, f)
+    logger.info(f"Reference profile saved to {path}")
+
+
+def _reference_entry(values: np.ndarray, n_bins: int) -> Dict[str, Any]:
+    mask = np.isnan(values)
+    valid = values[~mask]
+
+    # Inner cut points only; duplicates collapse for low-cardinality columns
+    edges = np.unique(np.quantile(valid, np.linspace(0, 1, n_bins + 1)[1:-1])) if len(valid) else np.array([])
+
+    sketch = StreamingSketch(edges)
+    sketch.update(valid)
+    props = sketch.proportions()
+
+    return {
+        "edges":       edges.tolist(),
+        "proportions": props.tolist() if props is not None else [0.0] * (len(edges) + 1),
+        "null_rate":   float(mask.mean()) if len(values) else 0.0,
+    }
+
+
+# ── Recent drift reports (served by GET /drift) ───────
+_reports: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+
+def record_report(job_id: str, report: Dict[str, Any]) -> None:
+    _reports[job_id] = report
+    _reports.move_to_end(job_id)
+    while len(_reports) > DRIFT_HISTORY_SIZE:
+        _reports.popitem(last=False)
+
+
+def get_report(job_id: str) -> Optional[Dict[str, Any]]:
+    return _reports.get(job_id)
+
+
+def list_reports() -> Dict[str, Dict[str, Any]]:
+    return dict(_reports)
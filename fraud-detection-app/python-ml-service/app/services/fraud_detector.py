@@ -20,7 +20,9 @@ import os
 import logging
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+from app.services.drift_monitor import DriftMonitor
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +35,28 @@ ANOMALY_THRESHOLD = float(os.getenv("ANOMALY_THRESHOLD", "0.7"))
 # Path to trained model file
 MODEL_PATH = os.getenv("MODEL_PATH", "./models/fraud_model.pkl")
 
+# Rows read and scored per chunk — bounds memory on large CSVs
+CHUNK_SIZE = int(os.getenv("CHUNK_SIZE", "100000"))
+
+# Columns never fed to the model
+# TODO: Replace with your actual feature columns from Phase 2
+EXCLUDED_COLUMNS = ['transaction_id', 'vendor_name', 'region', 'timestamp']
+
+# Low-cardinality text columns stored as pandas categoricals (codes + one
+# string per distinct value instead of one Python string per row)
+CATEGORICAL_COLUMNS = ['vendor_id', 'vendor_name', 'region']
+
+# Columns sent to Laravel as-is — never downcast, so IDs and money keep
+# full precision
+PASSTHROUGH_COLUMNS = ['vendor_id', 'amount']
+
+# Models that cast features to float32 themselves before scoring, so
+# float32 input gives identical scores. Other models keep float64 features.
+FLOAT32_MODELS = [
+    'DecisionTreeClassifier', 'RandomForestClassifier', 'ExtraTreesClassifier',
+    'GradientBoostingClassifier', 'XGBClassifier',
+]
+
 
 class FraudDetectorService:
     """
@@ -65,56 +89,136 @@ class FraudDetectorService:
             logger.error(f"Failed to load model: {e}")
             return None
 
-    async def predict(self, dataset_path: str) -> List[Dict[str, Any]]:
+    async def predict(
+        self,
+        dataset_path: str,
+        monitor: Optional[DriftMonitor] = None,
+        chunk_size: int = CHUNK_SIZE
+    ) -> List[Dict[str, Any]]:
         """
-        Run fraud detection on a CSV dataset.
+        Run fraud detection on a CSV dataset, chunk_size rows at a time.
 
         Args:
             dataset_path: Absolute path to the CSV file
+            monitor: Optional DriftMonitor updated with each scored chunk
+            chunk_size: Rows per chunk (DatasetValidator picks this from the file size)
 
         Returns:
             List of dicts with transaction_id, fraud_score, is_fraud, etc.
         """
         logger.info(f"Loading dataset from {dataset_path}")
 
-        # Load CSV
-        df = pd.read_csv(dataset_path)
-        logger.info(f"Loaded {len(df)} rows from dataset")
-
-        # Validate required columns
-        if 'transaction_id' not in df.columns:
-            raise ValueError("CSV must contain a 'transaction_id' column")
-
-        # Run predictions
-        if self.model is not None:
-            fraud_scores = self._predict_with_model(df)
-        else:
+        if self.model is None:
             # ── PLACEHOLDER: Replace with real model ──────────
             # This generates random scores for development/testing
             # until your Phase 2 model is integrated
             logger.warning("Using placeholder random predictions — replace with real model")
-            fraud_scores = self._placeholder_predictions(df)
+            rng = np.random.RandomState(42)
 
-        # Build results list
+        # vendor_id may be a numeric model feature, so it is only made
+        # categorical in _compact() when it turns out to be text
         results = []
-        for idx, row in df.iterrows():
-            score = float(fraud_scores[idx])
-            results.append({
-                "transaction_id": str(row["transaction_id"]),
-                "fraud_score":    round(score, 4),
-                "is_fraud":       score >= FRAUD_THRESHOLD,
-                "is_anomaly":     score >= ANOMALY_THRESHOLD,
-                "vendor_id":      str(row.get("vendor_id", "")) or None,
-                "vendor_name":    str(row.get("vendor_name", "")) or None,
-                "region":         str(row.get("region", "")) or None,
-                "amount":         float(row["amount"]) if "amount" in row and pd.notna(row["amount"]) else None,
-            })
+        reader = pd.read_csv(
+            dataset_path,
+            chunksize=chunk_size,
+            dtype={col: "category" for col in CATEGORICAL_COLUMNS if col != "vendor_id"}
+        )
+        for df in reader:
+            # Validate required columns
+            if 'transaction_id' not in df.columns:
+                raise ValueError("CSV must contain a 'transaction_id' column")
+
+            df = self._compact(df)
+
+            # Run predictions
+            if self.model is not None:
+                fraud_scores = self._predict_with_model(df)
+            else:
+                fraud_scores = self._placeholder_predictions(df, rng)
+
+            if monitor is not None and monitor.error is None:
+                try:
+                    monitor.update(df[self._feature_columns(df)], fraud_scores)
+                except Exception as e:
+                    # Drift monitoring must never fail fraud scoring
+                    logger.error(f"Drift monitor update failed, drift disabled for this dataset: {e}")
+                    monitor.error = str(e)
+
+            results.extend(self._build_results(df, fraud_scores))
+
+        logger.info(f"Loaded and scored {len(results)} rows from dataset")
 
         fraud_count = sum(1 for r in results if r["is_fraud"])
         logger.info(f"Prediction complete: {fraud_count}/{len(results)} flagged as fraud")
 
         return results
 
+    def _compact(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Shrink a chunk in memory: text columns in CATEGORICAL_COLUMNS become
+        categoricals and integer features the smallest integer type that
+        holds them. Float features become float32 only when the model is in
+        FLOAT32_MODELS (or the placeholder is used), so scores never change.
+        """
+        downcast_floats = self.model is None or type(self.model).__name__ in FLOAT32_MODELS
+
+        for col in df.columns:
+            if col in CATEGORICAL_COLUMNS and df[col].dtype == object:
+                df[col] = df[col].astype("category")
+            elif col in EXCLUDED_COLUMNS or col in PASSTHROUGH_COLUMNS:
+                continue
+            elif pd.api.types.is_float_dtype(df[col]):
+                if downcast_floats:
+                    df[col] = df[col].astype(np.float32)
+            elif pd.api.types.is_integer_dtype(df[col]):
+                df[col] = pd.to_numeric(df[col], downcast="integer")
+        return df
+
+    def _build_results(self, df: pd.DataFrame, fraud_scores: np.ndarray) -> List[Dict[str, Any]]:
+        """
+        Build result dicts column by column. Categorical columns are decoded
+        through their category list, so rows with the same vendor or region
+        share one string object.
+        """
+        n = len(df)
+        scores = np.asarray(fraud_scores, dtype=float)
+        is_fraud = (scores >= FRAUD_THRESHOLD).tolist()
+        is_anomaly = (scores >= ANOMALY_THRESHOLD).tolist()
+
+        if "amount" in df.columns:
+            amounts = [None if np.isnan(a) else a for a in df["amount"].astype(float).tolist()]
+        else:
+            amounts = [None] * n
+
+        return [
+            {
+                "transaction_id": tx_id,
+                "fraud_score":    round(score, 4),
+                "is_fraud":       fraud,
+                "is_anomaly":     anomaly,
+                "vendor_id":      vendor_id,
+                "vendor_name":    vendor_name,
+                "region":         region,
+                "amount":         amt,
+            }
+            for tx_id, score, fraud, anomaly, vendor_id, vendor_name, region, amt in zip(
+                df["transaction_id"].astype(str).tolist(),
+                scores.tolist(),
+                is_fraud,
+                is_anomaly,
+                _text_values(df, "vendor_id"),
+                _text_values(df, "vendor_name"),
+                _text_values(df, "region"),
+                amounts,
+            )
+        ]
+
+    def _feature_columns(self, df: pd.DataFrame) -> List[str]:
+        """
+        Select the columns fed to the model.
+        """
+        return [col for col in df.columns if col not in EXCLUDED_COLUMNS]
+
     def _predict_with_model(self, df: pd.DataFrame) -> np.ndarray:
         """
         Run predictions using the loaded ML model.
@@ -122,12 +226,7 @@ class FraudDetectorService:
         """
         # ── Feature engineering ───────────────────────────
         # Select and transform features to match training data
-        # TODO: Replace with your actual feature columns from Phase 2
-        feature_columns = [col for col in df.columns if col not in [
-            'transaction_id', 'vendor_name', 'region', 'timestamp'
-        ]]
-
-        X = df[feature_columns].fillna(0)
+        X = df[self._feature_columns(df)].fillna(0)
 
         # Get probability scores (column 1 = fraud probability)
         if hasattr(self.model, 'predict_proba'):
@@ -137,21 +236,47 @@ class FraudDetectorService:
 
         return scores
 
-    def _placeholder_predictions(self, df: pd.DataFrame) -> np.ndarray:
+    def _placeholder_predictions(self, df: pd.DataFrame, rng: np.random.RandomState) -> np.ndarray:
         """
         Placeholder predictions for development.
         Generates realistic-looking fraud scores with ~5% fraud rate.
+        `rng` is shared across chunks so each chunk gets fresh scores.
         REMOVE THIS and use _predict_with_model() in production.
         """
-        np.random.seed(42)
         n = len(df)
 
         # 95% of transactions are low-risk (0.0 - 0.3)
         # 5% are high-risk (0.5 - 1.0)
         scores = np.where(
-            np.random.random(n) < 0.05,
-            np.random.uniform(0.5, 1.0, n),   # High risk
-            np.random.uniform(0.0, 0.3, n)    # Low risk
+            rng.random_sample(n) < 0.05,
+            rng.uniform(0.5, 1.0, n),   # High risk
+            rng.uniform(0.0, 0.3, n)    # Low risk
         )
 
         return scores
+
+
+def _text_values(df: pd.DataFrame, col: str) -> List[Optional[str]]:
+    """
+    Per-row string values of `col`, None for missing / empty.
+    Categoricals are decoded once per category, not once per row.
+    Whole-number floats (an integer ID column that has gaps) are written
+    without the ".0", so they match chunks where the column has no gaps.
+    """
+    if col not in df.columns:
+        return [None] * len(df)
+
+    series = df[col]
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        labels = [_to_text(c) for c in series.cat.categories]
+        return [labels[code] if code >= 0 else None for code in series.cat.codes.tolist()]
+
+    return [_to_text(v) for v in series.tolist()]
+
+
+def _to_text(value) -> Optional[str]:
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return None
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value) or None
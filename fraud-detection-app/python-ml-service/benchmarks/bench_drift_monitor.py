@@ -0,0 +1,128 @@
+"""
+PHASE 8 — Drift Monitor Benchmark
+Measures the overhead of DriftMonitor on FraudDetectorService.predict().
+
+Builds a synthetic vendor CSV, scores it with a monitor that times each
+per-chunk update() inside predict(), and reports the update time as a
+fraction of the whole predict() call. report() is timed separately.
+
+Run from python-ml-service/:
+  python -m benchmarks.bench_drift_monitor --rows 500000
+  python -m benchmarks.bench_drift_monitor --rows 500000 --model   # RandomForest
+"""
+
+import os
+import time
+import asyncio
+import argparse
+import tempfile
+import numpy as np
+import pandas as pd
+
+from app.services import fraud_detector
+from app.services.drift_monitor import DriftMonitor, build_reference_profile
+
+FEATURES = ["vendor_id", "amount", "item_count", "hour"]
+
+
+def make_dataset(rows: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.RandomState(seed)
+    vendors = np.array([f"V{i:04d}" for i in range(500)])
+    regions = np.array(["Nairobi", "Mombasa", "Kisumu", "Nakuru", "Eldoret"])
+    amount = rng.lognormal(6, 1.2, rows)
+    amount[rng.random_sample(rows) < 0.01] = np.nan
+
+    return pd.DataFrame({
+        "transaction_id": [f"TX{i}" for i in range(rows)],
+        "vendor_id":      rng.randint(0, 500, rows),
+        "vendor_name":    vendors[rng.randint(0, 500, rows)],
+        "region":         regions[rng.randint(0, 5, rows)],
+        "amount":         amount,
+        "item_count":     rng.poisson(3, rows),
+        "hour":           rng.randint(0, 24, rows),
+    })
+
+
+class TimedDriftMonitor(DriftMonitor):
+    """
+    DriftMonitor that records how long each per-chunk update() takes.
+    """
+
+    def __init__(self, reference):
+        super().__init__(reference)
+        self.update_seconds = []
+
+    def update(self, features, scores):
+        start = time.perf_counter()
+        super().update(features, scores)
+        self.update_seconds.append(time.perf_counter() - start)
+
+
+def train_model(model_path: str) -> None:
+    """
+    Train and save a small RandomForest on the synthetic vendor features.
+    """
+    from sklearn.ensemble import RandomForestClassifier
+    import joblib
+
+    train = make_dataset(20000, seed=1)
+    label = (train["amount"].fillna(0) > 2000) & (train["hour"] < 6)
+    model = RandomForestClassifier(n_estimators=20, max_depth=8, random_state=0)
+    model.fit(train[FEATURES].fillna(0), label)
+    joblib.dump(model, model_path)
+
+
+async def main(rows: int, repeats: int, chunk_size: int, use_model: bool):
+    with tempfile.TemporaryDirectory() as tmp:
+        if use_model:
+            fraud_detector.MODEL_PATH = os.path.join(tmp, "model.pkl")
+            train_model(fraud_detector.MODEL_PATH)
+        detector = fraud_detector.FraudDetectorService()
+
+        # Reference built from a different sample of the same distribution
+        reference_df = make_dataset(min(rows, 100000), seed=1)
+        if detector.model is not None:
+            reference_scores = detector._predict_with_model(reference_df)
+        else:
+            reference_scores = detector._placeholder_predictions(reference_df, np.random.RandomState(1))
+        reference = build_reference_profile(
+            reference_df[detector._feature_columns(reference_df)],
+            reference_scores
+        )
+
+        path = os.path.join(tmp, "bench.csv")
+        make_dataset(rows).to_csv(path, index=False)
+
+        runs = []
+        for _ in range(repeats):
+            monitor = TimedDriftMonitor(reference)
+            start = time.perf_counter()
+            await detector.predict(path, monitor=monitor, chunk_size=chunk_size)
+            elapsed = time.perf_counter() - start
+
+            start = time.perf_counter()
+            report = monitor.report()
+            report_seconds = time.perf_counter() - start
+            runs.append((elapsed, monitor.update_seconds, report_seconds))
+
+    # Median run by share of predict() time spent in monitor updates
+    runs.sort(key=lambda r: sum(r[1]) / r[0])
+    elapsed, updates, report_seconds = runs[len(runs) // 2]
+
+    print(f"rows:                  {rows} ({len(updates)} chunks of {chunk_size})")
+    print(f"scorer:                {'RandomForest' if use_model else 'placeholder'}")
+    print(f"predict():             {elapsed:.3f}s")
+    print(f"update() per chunk:    {np.mean(updates) * 1000:.2f} ms (max {max(updates) * 1000:.2f} ms)")
+    print(f"update() total:        {sum(updates):.4f}s ({sum(updates) / elapsed:.2%} of predict)")
+    print(f"report():              {report_seconds * 1000:.2f} ms")
+    print(f"drifted columns:       {report['drifted_columns']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--chunk-size", type=int, default=fraud_detector.CHUNK_SIZE)
+    parser.add_argument("--model", action="store_true", help="score with a trained RandomForest")
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.repeats, args.chunk_size, args.model))
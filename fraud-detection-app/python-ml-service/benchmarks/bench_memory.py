@@ -0,0 +1,140 @@
+"""
+PHASE 8 — Memory Benchmark
+Compares peak RSS of the previous scoring path (chunked, inferred
+float64/object dtypes, iterrows() results) with the current compact
+path (float32/categorical chunks, column-wise results) on a synthetic
+vendor dataset, and checks both produce identical scores.
+
+Each path runs in a fresh process so peak RSS is measured independently.
+A small scikit-learn model is trained first so real model scores are
+compared, not placeholder ones:
+  --model rf      RandomForest — float features are downcast to float32
+  --model logreg  LogisticRegression — float features stay float64
+
+Besides peak RSS, each run reports how much memory the returned list of
+result dicts holds (RSS released when the list is deleted).
+
+Run from python-ml-service/:
+  python -m benchmarks.bench_memory --rows 1000000
+"""
+
+import os
+import gc
+import time
+import asyncio
+import argparse
+import resource
+import tempfile
+import multiprocessing
+import numpy as np
+import pandas as pd
+
+from benchmarks.bench_drift_monitor import make_dataset, FEATURES
+
+
+def previous_predict(detector, dataset_path: str, chunk_size: int) -> list:
+    """
+    FraudDetectorService.predict() as it was before compact dtypes:
+    chunks with inferred float64/object dtypes, results built with iterrows().
+    """
+    results = []
+    for df in pd.read_csv(dataset_path, chunksize=chunk_size):
+        fraud_scores = detector._predict_with_model(df)
+
+        for pos, (_, row) in enumerate(df.iterrows()):
+            score = float(fraud_scores[pos])
+            results.append({
+                "transaction_id": str(row["transaction_id"]),
+                "fraud_score":    round(score, 4),
+                "is_fraud":       score >= 0.5,
+                "is_anomaly":     score >= 0.7,
+                "vendor_id":      str(row.get("vendor_id", "")) or None,
+                "vendor_name":    str(row.get("vendor_name", "")) or None,
+                "region":         str(row.get("region", "")) or None,
+                "amount":         float(row["amount"]) if "amount" in row and pd.notna(row["amount"]) else None,
+            })
+    return results
+
+
+def current_rss_mb() -> float:
+    with open("/proc/self/statm") as f:
+        pages = int(f.read().split()[1])
+    return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+
+def run(mode: str, dataset_path: str, model_path: str, out_path: str, chunk_size: int) -> tuple:
+    from app.services import fraud_detector
+
+    fraud_detector.MODEL_PATH = model_path
+    detector = fraud_detector.FraudDetectorService()
+    start = time.perf_counter()
+
+    if mode == "previous":
+        results = previous_predict(detector, dataset_path, chunk_size)
+    else:
+        results = asyncio.run(detector.predict(dataset_path, chunk_size=chunk_size))
+
+    elapsed = time.perf_counter() - start
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    np.save(out_path, np.array([r["fraud_score"] for r in results]))
+    count = len(results)
+
+    before_free = current_rss_mb()
+    del results
+    gc.collect()
+    results_mb = before_free - current_rss_mb()
+
+    return peak_mb, results_mb, elapsed, count
+
+
+def train(model_name: str, model_path: str) -> None:
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.linear_model import LogisticRegression
+    import joblib
+
+    train_df = make_dataset(20000, seed=1)
+    label = (train_df["amount"].fillna(0) > 2000) & (train_df["hour"] < 6)
+    if model_name == "rf":
+        model = RandomForestClassifier(n_estimators=20, max_depth=8, random_state=0)
+    else:
+        model = LogisticRegression(max_iter=1000)
+    model.fit(train_df[FEATURES].fillna(0), label)
+    joblib.dump(model, model_path)
+
+
+def main(rows: int, chunk_size: int, model_name: str):
+    ctx = multiprocessing.get_context("spawn")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        dataset_path = os.path.join(tmp, "vendors.csv")
+        model_path = os.path.join(tmp, "model.pkl")
+        make_dataset(rows).to_csv(dataset_path, index=False)
+        train(model_name, model_path)
+
+        stats = {}
+        for mode in ("previous", "current"):
+            out_path = os.path.join(tmp, f"{mode}.npy")
+            with ctx.Pool(1) as pool:
+                stats[mode] = pool.apply(run, (mode, dataset_path, model_path, out_path, chunk_size))
+
+        identical = np.array_equal(
+            np.load(os.path.join(tmp, "previous.npy")),
+            np.load(os.path.join(tmp, "current.npy"))
+        )
+
+    print(f"rows:             {rows} (chunks of {chunk_size}, model {model_name})")
+    for mode, (peak_mb, results_mb, elapsed, count) in stats.items():
+        print(
+            f"{mode:8s} peak RSS {peak_mb:8.1f} MB   results list {results_mb:7.1f} MB   "
+            f"time {elapsed:7.2f}s   results {count}"
+        )
+    print(f"identical scores: {identical}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=500000)
+    parser.add_argument("--chunk-size", type=int, default=100000)
+    parser.add_argument("--model", choices=["rf", "logreg"], default="rf")
+    args = parser.parse_args()
+    main(args.rows, args.chunk_size, args.model)
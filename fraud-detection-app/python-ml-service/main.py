@@ -6,6 +6,7 @@ Receives dataset processing requests from Laravel and posts results back.
 Architecture:
   Laravel → POST /process-dataset → Python processes → POST callback to Laravel
   Laravel → POST /explain         → Python generates SHAP → POST callback to Laravel
+  Laravel → GET  /drift/{job_id}  → Python returns the job's drift report
 
 Run with:
   uvicorn main:app --host 0.0.0.0 --port 5000 --reload
@@ -23,6 +24,7 @@ import logging
 from app.routes.predict import router as predict_router
 from app.routes.explain import router as explain_router
 from app.routes.health import router as health_router
+from app.routes.drift import router as drift_router
 from app.middleware.auth import verify_ml_secret
 
 # Configure logging
@@ -53,6 +55,7 @@ app.add_middleware(
 app.include_router(health_router)
 app.include_router(predict_router, dependencies=[Depends(verify_ml_secret)])
 app.include_router(explain_router, dependencies=[Depends(verify_ml_secret)])
+app.include_router(drift_router, dependencies=[Depends(verify_ml_secret)])
 
 if __name__ == "__main__":
     uvicorn.run("main:app", host="0.0.0.0", port=5000, reload=True)
@@ -0,0 +1,128 @@
+"""
+PHASE 8 — Dataset Validator Tests
+Run from python-ml-service/:  pytest
+"""
+
+import pytest
+
+from app.services import dataset_validator
+from app.services.dataset_validator import DatasetValidator, choose_chunk_size
+
+
+def write(tmp_path, content, name="data.csv", mode="w"):
+    path = tmp_path / name
+    if mode == "wb":
+        path.write_bytes(content)
+    else:
+        path.write_text(content)
+    return str(path)
+
+
+def numbered_rows(n, template="T{i},{i}\n"):
+    return "".join(template.format(i=i) for i in range(n))
+
+
+def test_valid_file_and_row_estimate(tmp_path):
+    path = write(tmp_path, "transaction_id,amount,hour\n" + numbered_rows(5000, "T{i},12.5,3\n"))
+    report = DatasetValidator(["amount", "hour"]).validate(path)
+
+    assert report["valid"] is True
+    assert report["errors"] == [] and report["warnings"] == []
+    assert report["columns"] == ["transaction_id", "amount", "hour"]
+    assert report["estimated_rows"] == pytest.approx(5000, rel=0.05)
+
+
+def test_large_file_is_sampled_not_read(tmp_path, monkeypatch):
+    monkeypatch.setattr(dataset_validator, "SAMPLE_RANGES", 4)
+    monkeypatch.setattr(dataset_validator, "SAMPLE_BYTES", 1024)
+    path = write(tmp_path, "transaction_id,amount\n" + numbered_rows(20000, "T{i:06d},{i:06d}\n"))
+    report = DatasetValidator().validate(path)
+
+    assert report["valid"] is True
+    assert report["estimated_rows"] == pytest.approx(20000, rel=0.1)
+
+
+def test_missing_transaction_id_and_expected_feature(tmp_path):
+    path = write(tmp_path, "id,amount\n1,2\n")
+    report = DatasetValidator(["amount", "hour"]).validate(path)
+
+    assert report["valid"] is False
+    assert "CSV must contain a 'transaction_id' column" in report["errors"]
+    assert any("['hour']" in e for e in report["errors"])
+
+
+def test_empty_file_and_header_only(tmp_path):
+    assert DatasetValidator().validate(write(tmp_path, "", "empty.csv"))["errors"] == [
+        "CSV file is empty or has no header row"
+    ]
+    assert DatasetValidator().validate(write(tmp_path, "transaction_id,amount\n", "hdr.csv"))["errors"] == [
+        "CSV file has a header but no rows"
+    ]
+
+
+def test_single_over_width_row_is_an_error(tmp_path):
+    # pandas raises ParserError on this file, so it must be rejected up front
+    rows = numbered_rows(500) + "T500,1,2\n" + numbered_rows(499)
+    report = DatasetValidator().validate(write(tmp_path, "transaction_id,amount\n" + rows))
+
+    assert report["valid"] is False
+    assert report["errors"] == ["1/1000 sampled rows have more than 2 fields"]
+
+
+def test_under_width_row_is_only_a_warning(tmp_path):
+    report = DatasetValidator().validate(write(tmp_path, "transaction_id,amount,hour\nT1,1,2\nT2,3\n"))
+
+    assert report["valid"] is True
+    assert report["warnings"] == ["1/2 sampled rows have fewer than 3 fields"]
+
+
+def test_quoted_multiline_field_is_accepted(tmp_path):
+    path = write(tmp_path, 'transaction_id,vendor_name,amount\nT1,"Acme\nInc",3\nT2,Foo,4\n')
+    report = DatasetValidator().validate(path)
+
+    assert report["valid"] is True
+    assert report["errors"] == [] and report["warnings"] == []
+
+
+def test_non_numeric_amount_is_an_error_without_reference(tmp_path):
+    report = DatasetValidator().validate(write(tmp_path, "transaction_id,amount\nT1,abc\nT2,4\n"))
+
+    assert report["valid"] is False
+    assert report["errors"] == ["Column 'amount' contains non-numeric values"]
+
+
+def test_non_numeric_feature_without_reference_is_an_error(tmp_path):
+    report = DatasetValidator().validate(write(tmp_path, "transaction_id,hour,amount\nT1,night,1\n"))
+    assert report["errors"] == ["Column 'hour' contains non-numeric values"]
+
+
+def test_text_vendor_id_is_allowed(tmp_path):
+    report = DatasetValidator().validate(write(tmp_path, "transaction_id,vendor_id,amount\nT1,V001,1\n"))
+    assert report["valid"] is True
+
+
+def test_with_reference_only_model_features_and_amount_are_required(tmp_path):
+    path = write(tmp_path, "transaction_id,hour,notes,amount\nT1,3,free text,1\n")
+    report = DatasetValidator(["hour"]).validate(path)
+
+    assert report["valid"] is True
+    assert report["warnings"] == ["Column 'notes' contains non-numeric values"]
+
+
+def test_missing_values_are_not_non_numeric(tmp_path):
+    report = DatasetValidator().validate(write(tmp_path, "transaction_id,amount\nT1,\nT2,NA\nT3,5\n"))
+    assert report["valid"] is True
+
+
+def test_crlf_without_trailing_newline_rounds_estimate(tmp_path):
+    path = write(tmp_path, b"transaction_id,amount\r\nT1,3\r\nT2,4", mode="wb")
+    assert DatasetValidator().validate(path)["estimated_rows"] == 2
+
+
+def test_choose_chunk_size_bounds(monkeypatch):
+    monkeypatch.setattr(dataset_validator, "CHUNK_SIZE", 100000)
+    monkeypatch.setattr(dataset_validator, "TARGET_CHUNK_BYTES", 1000000)
+
+    assert choose_chunk_size(50) == 20000
+    assert choose_chunk_size(1) == 100000
+    assert choose_chunk_size(10000) == dataset_validator.MIN_CHUNK_SIZE
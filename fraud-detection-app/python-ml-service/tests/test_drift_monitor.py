@@ -0,0 +1,120 @@
+"""
+PHASE 8 — Drift Monitor Tests
+Run from python-ml-service/:  pytest
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services import drift_monitor
+from app.services.drift_monitor import (
+    DriftMonitor,
+    StreamingSketch,
+    build_reference_profile,
+    population_stability_index,
+    record_report,
+    get_report,
+    list_reports,
+)
+
+
+def test_psi_is_zero_for_identical_distributions():
+    props = np.array([0.25, 0.25, 0.5])
+    assert population_stability_index(props, props) == pytest.approx(0.0)
+
+
+def test_psi_matches_formula_and_handles_empty_bins():
+    expected = np.array([0.5, 0.5])
+    actual = np.array([0.9, 0.1])
+    manual = (0.9 - 0.5) * np.log(0.9 / 0.5) + (0.1 - 0.5) * np.log(0.1 / 0.5)
+    assert population_stability_index(expected, actual) == pytest.approx(manual)
+
+    # An empty bin is clipped instead of producing inf / nan
+    assert np.isfinite(population_stability_index(expected, np.array([1.0, 0.0])))
+
+
+def test_sketch_counts_nulls_and_bins():
+    sketch = StreamingSketch([1.0, 2.0])
+    sketch.update([0.5, 1.0, 1.5, 2.5, np.nan])
+    sketch.update([3.0])
+
+    assert sketch.total == 6
+    assert sketch.nulls == 1
+    # Values on an edge go to the right-hand bin
+    assert sketch.counts.tolist() == [1, 2, 2]
+    assert sketch.summary()["null_rate"] == pytest.approx(1 / 6, abs=1e-6)
+    assert sketch.min == 0.5 and sketch.max == 3.0
+
+
+def test_sketch_quantiles_are_close_on_uniform_data():
+    values = np.random.RandomState(0).uniform(0, 100, 50000)
+    sketch = StreamingSketch(np.linspace(0, 100, 11)[1:-1])
+    for chunk in np.array_split(values, 5):
+        sketch.update(chunk)
+
+    assert sketch.quantile(0.5) == pytest.approx(50, abs=1)
+    assert sketch.quantile(0.9) == pytest.approx(90, abs=1)
+
+
+def test_sketch_without_edges_reports_basic_stats_only():
+    sketch = StreamingSketch()
+    sketch.update([1.0, 3.0])
+    summary = sketch.summary()
+
+    assert summary["mean"] == 2.0
+    assert summary["p50"] is None
+
+
+def _frame(seed: int, rows: int = 20000, shift: float = 0.0) -> pd.DataFrame:
+    rng = np.random.RandomState(seed)
+    return pd.DataFrame({
+        "amount": rng.lognormal(6, 1, rows) + shift,
+        "hour":   rng.randint(0, 24, rows),
+    })
+
+
+def test_no_drift_on_same_distribution():
+    reference = build_reference_profile(_frame(1), np.random.RandomState(1).uniform(0, 1, 20000))
+    monitor = DriftMonitor(reference)
+    df = _frame(2)
+    for start in range(0, len(df), 5000):
+        chunk = df.iloc[start:start + 5000]
+        monitor.update(chunk, np.random.RandomState(start).uniform(0, 1, len(chunk)))
+
+    report = monitor.report()
+    assert report["has_reference"] is True
+    assert report["drifted_columns"] == []
+    assert report["features"]["amount"]["ks"] < 0.05
+
+
+def test_shifted_feature_and_score_are_flagged():
+    reference = build_reference_profile(_frame(1), np.random.RandomState(1).uniform(0, 0.3, 20000))
+    monitor = DriftMonitor(reference)
+    monitor.update(_frame(2, shift=1000.0), np.random.RandomState(2).uniform(0.5, 1.0, 20000))
+
+    report = monitor.report()
+    assert "amount" in report["drifted_columns"]
+    assert drift_monitor.SCORE_KEY in report["drifted_columns"]
+    assert "hour" not in report["drifted_columns"]
+
+
+def test_monitor_without_reference_has_no_psi():
+    monitor = DriftMonitor()
+    monitor.update(_frame(1, rows=100), np.random.RandomState(1).uniform(0, 1, 100))
+
+    report = monitor.report()
+    assert report["has_reference"] is False
+    assert report["features"]["amount"]["psi"] is None
+    assert report["drifted_columns"] == []
+
+
+def test_report_history_is_bounded(monkeypatch):
+    monkeypatch.setattr(drift_monitor, "DRIFT_HISTORY_SIZE", 2)
+    monkeypatch.setattr(drift_monitor, "_reports", drift_monitor.OrderedDict())
+
+    for job_id in ("a", "b", "c"):
+        record_report(job_id, {"job": job_id})
+
+    assert get_report("a") is None
+    assert list(list_reports()) == ["b", "c"]
@@ -0,0 +1,112 @@
+"""
+PHASE 8 — Fraud Detector Tests
+Run from python-ml-service/:  pytest
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services import fraud_detector
+from app.services.fraud_detector import FraudDetectorService, _text_values, _to_text
+from app.services.drift_monitor import DriftMonitor, build_reference_profile
+
+
+@pytest.fixture
+def detector(monkeypatch):
+    monkeypatch.setattr(fraud_detector, "MODEL_PATH", "/nonexistent/model.pkl")
+    return FraudDetectorService()
+
+
+@pytest.mark.asyncio
+async def test_float32_features_do_not_cause_false_drift(detector, tmp_path):
+    # Values sitting exactly on reference edges: float32(0.7) < 0.7 used to
+    # move every row one bin left and flag drift on unchanged data
+    rows = 20000
+    df = pd.DataFrame({
+        "transaction_id": [f"T{i}" for i in range(rows)],
+        "discount":       np.random.RandomState(0).choice([0.0, 0.7, 1.3], rows),
+    })
+    path = tmp_path / "same.csv"
+    df.to_csv(path, index=False)
+
+    reference = build_reference_profile(
+        df[["discount"]],
+        detector._placeholder_predictions(df, np.random.RandomState(42))
+    )
+    monitor = DriftMonitor(reference)
+    await detector.predict(str(path), monitor=monitor, chunk_size=7000)
+
+    report = monitor.report()
+    assert report["features"]["discount"]["psi"] == pytest.approx(0.0, abs=1e-6)
+    assert report["drifted_columns"] == []
+
+
+@pytest.mark.asyncio
+async def test_results_keep_ids_exact_and_missing_as_none(detector, tmp_path):
+    path = tmp_path / "vendors.csv"
+    path.write_text(
+        "transaction_id,vendor_id,vendor_name,region,amount\n"
+        "T1,123456789,Acme,,10.5\n"
+        "T2,,,North,\n"
+        "T3,987654321,Foo,South,3\n"
+    )
+
+    results = await detector.predict(str(path))
+
+    assert [r["vendor_id"] for r in results] == ["123456789", None, "987654321"]
+    assert [r["vendor_name"] for r in results] == ["Acme", None, "Foo"]
+    assert [r["region"] for r in results] == [None, "North", "South"]
+    assert [r["amount"] for r in results] == [10.5, None, 3.0]
+
+
+def test_compact_downcasts_floats_only_for_float32_models(detector):
+    df = pd.DataFrame({
+        "transaction_id": ["T1", "T2"],
+        "vendor_name":    ["Acme", "Acme"],
+        "amount":         [1.5, 2.5],
+        "rate":           [0.1, 0.2],
+        "count":          [1, 2],
+    })
+
+    compact = detector._compact(df.copy())
+    assert compact["rate"].dtype == np.float32
+    assert compact["amount"].dtype == np.float64
+    assert compact["count"].dtype == np.int8
+    assert isinstance(compact["vendor_name"].dtype, pd.CategoricalDtype)
+
+    class LogisticRegression:
+        pass
+
+    detector.model = LogisticRegression()
+    compact = detector._compact(df.copy())
+    assert compact["rate"].dtype == np.float64
+    assert compact["count"].dtype == np.int8
+
+
+def test_text_values_decodes_categoricals_and_missing():
+    df = pd.DataFrame({
+        "region": pd.Categorical(["North", None, "North", ""]),
+        "vendor_id": [12.0, np.nan, 7.5, 3.0],
+    })
+
+    regions = _text_values(df, "region")
+    assert regions == ["North", None, "North", None]
+    # Rows with the same category share one string object
+    assert regions[0] is regions[2]
+
+    assert _text_values(df, "vendor_id") == ["12", None, "7.5", "3"]
+    assert _text_values(df, "vendor_name") == [None] * 4
+
+
+@pytest.mark.parametrize("value, expected", [
+    (None, None),
+    (float("nan"), None),
+    ("", None),
+    (123456789.0, "123456789"),
+    (2.5, "2.5"),
+    (42, "42"),
+    ("V001", "V001"),
+])
+def test_to_text(value, expected):
+    assert _to_text(value) == expected
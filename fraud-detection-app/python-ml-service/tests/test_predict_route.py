@@ -0,0 +1,84 @@
+"""
+PHASE 8 — Prediction Route Tests
+Run from python-ml-service/:  pytest
+"""
+
+import pytest
+
+from app.routes import predict
+from app.services import callback_service
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    """
+    Capture results callbacks instead of POSTing to Laravel.
+    """
+    calls = []
+
+    async def fake_post_results(self, **kwargs):
+        calls.append(kwargs)
+        return True
+
+    monkeypatch.setattr(callback_service.CallbackService, "post_results", fake_post_results)
+    return calls
+
+
+@pytest.fixture
+def small_csv(tmp_path):
+    path = tmp_path / "small.csv"
+    path.write_text("transaction_id,amount\nT1,3\nT2,4\n")
+    return str(path)
+
+
+@pytest.mark.parametrize("profile", [
+    {"score": {"proportions": [1.0]}},                                  # missing edges
+    {"score": {"edges": [0.5], "proportions": [0.2, 0.3, 0.5]}},        # report() fails
+    {"features": {"amount": {"proportions": [1.0]}}},                   # update() fails
+])
+@pytest.mark.asyncio
+async def test_drift_errors_do_not_fail_scoring(sent, small_csv, profile):
+    await predict._process_and_callback(1, small_csv, "job-1", "http://laravel", 1000, profile)
+
+    assert sent[0]["status"] == "success"
+    assert len(sent[0]["results"]) == 2
+    assert sent[0]["drift"] is None
+
+
+@pytest.fixture
+def client(monkeypatch, sent):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    monkeypatch.setattr(predict, "load_reference_profile", lambda: None)
+    app = FastAPI()
+    app.include_router(predict.router)
+    return TestClient(app)
+
+
+def _request(path):
+    return {"dataset_id": 1, "dataset_path": path, "job_id": "job-1", "callback_url": "http://laravel"}
+
+
+def test_invalid_dataset_is_rejected_with_422(client, tmp_path, sent):
+    path = tmp_path / "bad.csv"
+    path.write_text("id,amount\n1,abc\n")
+
+    response = client.post("/process-dataset", json=_request(str(path)))
+
+    assert response.status_code == 422
+    detail = response.json()["detail"]
+    assert detail["valid"] is False
+    assert "CSV must contain a 'transaction_id' column" in detail["errors"]
+    assert sent == []
+
+
+def test_valid_dataset_is_accepted_with_estimate(client, small_csv, sent):
+    response = client.post("/process-dataset", json=_request(small_csv))
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "accepted"
+    assert body["estimated_rows"] == 2
+    # Background task ran and reported success
+    assert sent[0]["status"] == "success"